@@ -1,29 +1,128 @@
-import time, random, os, csv
+import time, os, csv
+import atexit
 import logging
+import logging.handlers
+import queue
 import urllib.parse
+import functools
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
 
-from bs4 import BeautifulSoup
-import pickle
-import pandas as pd
-from urllib.request import urlopen
-import urllib.parse
+from selectolax.parser import HTMLParser
+import json
+import hashlib
+import requests
+import requests.adapters
 
 import re
-import yaml
 from datetime import datetime, timedelta
 
 log = logging.getLogger(__name__)
 retrieveCookies = False
 
+# Format of the timestamp column in the output CSV
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+COOKIES_FILE = "cookies.json"
+LEGACY_COOKIES_FILE = "cookies.pkl"  # written by older versions, migrated on first load
+
+JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+VOYAGER_SEARCH_URL = "https://www.linkedin.com/voyager/api/search/blended"
+VOYAGER_PAGE_SIZE = 10
+# Entity types of the search response that hold a feed post
+VOYAGER_UPDATE_TYPES = ("com.linkedin.voyager.feed.render.UpdateV2", "com.linkedin.voyager.dash.feed.Update")
+VOYAGER_SEARCH_RESULT_TYPE = "com.linkedin.voyager.dash.search.EntityResultViewModel"
+VOYAGER_POST_URN_KINDS = ("urn:li:activity:", "urn:li:fsd_update:", "urn:li:ugcPost:")
+VOYAGER_JOB_POSTING_URL = "https://www.linkedin.com/voyager/api/jobs/jobPostings"
+# Job postings fetched in parallel from the Voyager API, kept low to stay under LinkedIn's rate limits
+JOB_FETCH_WORKERS = 10
+
+# Post fingerprints remembered across searches, the oldest ones are forgotten past this size
+MAX_PROCESSED_POSTS = 50000
+
+# Fallback selectors for the parts of a feed post, tried in order since LinkedIn keeps renaming its classes
+POST_TEXT_SELECTORS = (
+    ".feed-shared-update-v2__description-wrapper",
+    ".feed-shared-text",
+    ".update-components-text",
+    ".update-components-actor--feed-update-text",
+)
+POST_AUTHOR_SELECTORS = (
+    ".update-components-actor__name",
+    ".feed-shared-actor__title",
+    ".update-components-actor__meta-link",
+)
+
+# Subresources the bot never reads. Stylesheets stay allowed, SEE_MORE_JS uses offsetParent to skip hidden toggles
+BLOCKED_URLS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*doubleclick*", "*google-analytics*", "*/li/track*", "*px.ads.linkedin.com*",
+]
+
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+
+# Job-related keywords a feed post must mention (at least 2 distinct ones) to be collected
+JOB_KEYWORDS_RE = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in [
+            "hiring", "job", "position", "opportunity", "remote", "full stack", "developer",
+            "opening", "looking for", "join our team", "apply", "application", "react", "node",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Expands the job description and reads every field of the job page in a single round trip.
+# The description uses textContent so it does not depend on the "show more" expansion having rendered yet.
+JOB_DETAILS_JS = """
+const text = (selector) => ((document.querySelector(selector) || {}).innerText || "");
+const showMore = document.querySelector(".jobs-description__footer-button");
+if (showMore) showMore.click();
+return {
+    company: text(".job-details-jobs-unified-top-card__company-name"),
+    subtitle: text(".job-details-jobs-unified-top-card__primary-description-container"),
+    title: text(".job-details-jobs-unified-top-card__job-title"),
+    description: (document.querySelector(".jobs-description-content__text") || {}).textContent || "",
+    salary: text(".job-details-jobs-unified-top-card__job-insight"),
+    logo: (document.querySelector("img[height*='40']") || {}).src || "",
+};
+"""
+
+# Counts the visible "see more" toggles of feed posts, clicking them when arguments[0] is true.
+SEE_MORE_JS = """
+const toggles = [...document.querySelectorAll(".feed-shared-inline-show-more-text__see-more-less-toggle.see-more")]
+    .filter((toggle) => toggle.offsetParent !== null);
+if (arguments[0]) toggles.forEach((toggle) => toggle.click());
+return toggles.length;
+"""
+
+# Reads the id, title and company of every job card in the results list in a single round trip.
+JOB_CARDS_JS = """
+const text = (card, selector) => ((card.querySelector(selector) || {}).innerText || "");
+return Array.from(document.querySelectorAll("div[data-job-id]"), (card) => ({
+    id: card.getAttribute("data-job-id"),
+    title: text(card, ".job-card-list__title"),
+    company: text(card, ".job-card-container__primary-description"),
+}));
+"""
+
+# True once the last job card of the results list has its title rendered, the list fills in lazily while scrolling
+JOB_CARDS_RENDERED_JS = """
+const cards = document.querySelectorAll("div[data-job-id]");
+const last = cards[cards.length - 1];
+return Boolean(last && (last.querySelector(".job-card-list__title") || {}).innerText);
+"""
+
 # LINUX BOX:
 # from pyvirtualdisplay import Display
 # display = Display(visible=1, size=(1920, 1080))
@@ -31,17 +130,99 @@ retrieveCookies = False
 # s = webdriver.chrome.service.Service('/usr/bin/chromedriver')
 # driver = webdriver.Chrome(service=s)
 
-driver = webdriver.Chrome()
+def write_file_atomically(filename, content):
+    # Write next to the target and swap it in, a crash mid-write never leaves a truncated file behind
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "w") as f:
+        f.write(content)
+    os.replace(tmp_filename, filename)
+
+
+def first_match(node, selectors):
+    for selector in selectors:
+        element = node.css_first(selector)
+        if element:
+            return element
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def jobs_search_url(position, location, start):
+    # Easy Apply: f_LF=f_AL
+    # Some other things you can do:
+    # - Internships: f_E=1
+    # - Entry Level: f_E=2
+    params = {
+        "keywords": position,
+        "location": location,
+        "f_E": 2,
+        "f_TPR": "r2592000",  # r2592000 for 30 days | #r604800 for 7 days
+        "start": start,
+    }
+    return JOBS_SEARCH_URL + "?" + urllib.parse.urlencode(params)
+
+
+def api_post(entity):
+    """Read (post_id, post_text, company_name, post_link) from a search entity, None if it is not a post"""
+    entity_type = entity.get("$type", "")
+    post_id = entity.get("entityUrn") or entity.get("trackingUrn") or ""
+    if entity_type in VOYAGER_UPDATE_TYPES:
+        post_text = (entity.get("commentary") or {}).get("text") or {}
+        company_name = ((entity.get("actor") or {}).get("name") or {}).get("text")
+    elif entity_type == VOYAGER_SEARCH_RESULT_TYPE and any(kind in post_id for kind in VOYAGER_POST_URN_KINDS):
+        # search results also list the people and companies matching the query, only posts are kept
+        post_text = entity.get("summary") or {}
+        company_name = (entity.get("title") or {}).get("text")
+    else:
+        return None
+
+    post_text = post_text.get("text") if isinstance(post_text, dict) else post_text
+    if not post_text or not post_id:
+        return None
+    return post_id, post_text, company_name or "Unknown Company", entity.get("navigationUrl") or "URL not found"
+
+
+def api_salary(payload):
+    # Same shape as the top card insight ("$120,000/yr - $150,000/yr"), empty when the posting has no salary
+    posting = payload.get("data", payload)
+    if posting.get("formattedSalaryDescription"):
+        return posting["formattedSalaryDescription"]
+    for entity in [posting] + payload.get("included", []):
+        for breakdown in (entity.get("salaryInsights") or {}).get("compensationBreakdown") or []:
+            if not breakdown.get("minSalary"):
+                continue
+            amounts = [breakdown["minSalary"], breakdown.get("maxSalary")]
+            if breakdown.get("currencyCode", "USD") == "USD":
+                return " - ".join(f"${float(amount):,.0f}" for amount in amounts if amount)
+            return " - ".join(str(amount) for amount in amounts if amount) + " " + breakdown["currencyCode"]
+    return ""
+
+
+def api_company_logo(company):
+    image = ((company.get("logo") or {}).get("image") or {}).get("com.linkedin.common.VectorImage") or {}
+    artifacts = image.get("artifacts") or []
+    if not image.get("rootUrl") or not artifacts:
+        return ""
+    return image["rootUrl"] + artifacts[0]["fileIdentifyingUrlPathSegment"]
+
+
+def create_driver(options):
+    driver = webdriver.Chrome(options=options)
+
+    stealth(
+        driver,
+        languages=["en-US", "en"],
+        vendor="Google Inc.",
+        platform="Win32",
+        webgl_vendor="Intel Inc.",
+        renderer="Intel Iris OpenGL Engine",
+        fix_hairline=True,
+    )
 
-stealth(
-    driver,
-    languages=["en-US", "en"],
-    vendor="Google Inc.",
-    platform="Win32",
-    webgl_vendor="Intel Inc.",
-    renderer="Intel Iris OpenGL Engine",
-    fix_hairline=True,
-)
+    # Images are already off through the browser options, drop fonts, media and trackers too
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    return driver
 
 def setupLogger():
     dt = datetime.strftime(datetime.now(), "%m_%d_%y %H_%M_%S ")
@@ -49,12 +230,14 @@ def setupLogger():
     if not os.path.isdir("./logs"):
         os.mkdir("./logs")
 
-    logging.basicConfig(
-        filename=("./logs/" + str(dt) + "applyJobs.log"),
-        filemode="w",
-        format="%(asctime)s::%(name)s::%(levelname)s::%(message)s",
-        datefmt="./logs/%d-%b-%y %H:%M:%S",
+    # Rotate instead of growing without bound during a 10 hour search
+    f_handler = logging.handlers.RotatingFileHandler(
+        "./logs/" + str(dt) + "applyJobs.log", maxBytes=5 * 1024 * 1024, backupCount=3
+    )
+    f_format = logging.Formatter(
+        "%(asctime)s::%(name)s::%(levelname)s::%(message)s", "./logs/%d-%b-%y %H:%M:%S"
     )
+    f_handler.setFormatter(f_format)
 
     log.setLevel(logging.DEBUG)
     c_handler = logging.StreamHandler()
@@ -63,7 +246,15 @@ def setupLogger():
         "%(asctime)s - %(levelname)s - %(message)s", "%H:%M:%S"
     )
     c_handler.setFormatter(c_format)
-    log.addHandler(c_handler)
+    # Only the bot's own messages go to the console, the file also gets warnings from libraries
+    c_handler.addFilter(logging.Filter(__name__))
+
+    # Callers only enqueue records, a background thread does the file and console writes
+    log_queue = queue.Queue(-1)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, f_handler, c_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
 
 class EasyApplyBot:
@@ -71,6 +262,13 @@ class EasyApplyBot:
     # MAX_SEARCH_TIME is 10 hours by default, feel free to modify it
     MAX_SEARCH_TIME = 10 * 60 * 60
 
+    # Locators used on every page, built once instead of per lookup
+    SEARCH_RESULTS_CONTAINER = (By.CLASS_NAME, "search-results-container")
+    FEED_POST = (By.CLASS_NAME, "ember-view")
+    SEARCH_RESULTS_LIST = (By.CLASS_NAME, "jobs-search-results-list")
+    JOB_DESCRIPTION = (By.CLASS_NAME, "jobs-description-content__text")
+    GLOBAL_NAV = (By.ID, "global-nav")
+
     def __init__(
         self,
         username=None,
@@ -81,48 +279,72 @@ class EasyApplyBot:
         positions=[],
         locations=[],
         keywords=[],
+        headless=False,
     ):
 
         log.info("LinkedIn JobAlert Bot by Landon Crabtree.")
         log.info("Forked from LinkedIn-Easy-Apply-Bot by nicolomantini")
 
-        self.appliedJobIDs = self.get_appliedIDs(filename) if self.get_appliedIDs(filename) != None else []
+        self.appliedJobIDs = set(self.get_appliedIDs(filename) or [])
         self.filename = filename
-        self.options = self.browser_options()
-        self.browser = driver
+        self.output_file = open(self.filename, "a", newline="", encoding="utf-8", buffering=65536)
+        self.output_writer = csv.writer(self.output_file)
+        atexit.register(self.output_file.close)
+        self.options = self.browser_options(headless)
+        self.browser = create_driver(self.options)
         self.wait = WebDriverWait(self.browser, 5)
+        self.long_wait = WebDriverWait(self.browser, 10)
         self.blacklistCompanies = blacklistCompanies
         self.blackListTitles = blackListTitles
+        self.blacklistCompaniesLower = frozenset(x.lower() for x in blacklistCompanies)
+        self.blackListTitlesLower = frozenset(x.lower() for x in blackListTitles)
         self.positions = positions
         self.locations = locations
         self.keywords = keywords
-        self.collected_emails = []  # Lista para armazenar e-mails coletados
+        self.keywordsLower = [(keyword, keyword.lower()) for keyword in keywords]
+        self.processed_posts = OrderedDict()  # 8-byte fingerprints of posts already processed
+        self.api_session = None  # requests session for the Voyager API, built from the browser cookies
+        self.collected_emails = set()  # Conjunto de e-mails únicos coletados
+        self.emails_found_count = 0  # Total de e-mails encontrados, incluindo repetidos
 
         log.info(f"Loaded {len(self.appliedJobIDs)} applied job IDs from {filename}")
 
         self.authenticate(username, password)
 
     def get_appliedIDs(self, filename):
+        cutoff = datetime.now() - timedelta(days=7)
+        jobIDs = []
         try:
-            df = pd.read_csv(
-                filename,
-                header=None,
-                names=["timestamp", "jobID", "job", "company", "matches", "result"],
-                lineterminator="\n",
-                encoding="utf-8",
-            )
-
-            df["timestamp"] = pd.to_datetime(
-                df["timestamp"], format="%Y-%m-%d %H:%M:%S"
-            )
-            df = df[df["timestamp"] > (datetime.now() - timedelta(days=7))]
-            jobIDs = list(df.jobID)
+            with open(filename, newline="", encoding="utf-8", errors="replace") as f:
+                # columns: timestamp, jobID, job, company, matches, result
+                for row in csv.reader(f):
+                    if len(row) < 2:
+                        continue
+                    try:
+                        timestamp = datetime.strptime(row[0], TIMESTAMP_FORMAT)
+                    except ValueError:
+                        continue
+                    if timestamp <= cutoff:
+                        continue
+                    # Feed posts are stored with their URN instead of a numeric job ID
+                    jobIDs.append(int(row[1]) if row[1].isdigit() else row[1])
             return jobIDs
+        except FileNotFoundError:
+            return []
         except Exception as e:
+            log.error(f"Error reading applied job IDs: {str(e)}")
             return None
 
-    def browser_options(self):
+    def browser_options(self, headless=False):
         options = Options()
+        # Return from get() at DOMContentLoaded instead of waiting for every subresource
+        options.page_load_strategy = "eager"
+        if headless:
+            # Only usable once cookies.json holds a valid session, the first login is manual
+            options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         options.add_argument("--no-sandbox")
         options.add_argument("--start-maximized")
         options.add_argument("--ignore-certificate-errors")
@@ -131,18 +353,24 @@ class EasyApplyBot:
         options.add_argument("--disable-blink-features=AutomationControlled")
         return options
 
+    def logged_in(self, driver, paths):
+        # The URL alone is not enough, the login, checkpoint and authwall pages carry
+        # "feed" in their session_redirect parameter. Only logged in pages have the global nav.
+        path = urllib.parse.urlparse(driver.current_url).path
+        return path.startswith(paths) and bool(driver.find_elements(*self.GLOBAL_NAV))
+
     def authenticate(self, username, password):
         # Try to load existing cookies first
         if self.load_cookies():
             log.info("Loaded saved cookies, checking if still logged in...")
             self.browser.get("https://www.linkedin.com/feed/")
-            time.sleep(3)
 
             # Check if we're successfully logged in with cookies
-            if "feed" in self.browser.current_url:
+            try:
+                self.long_wait.until(lambda d: self.logged_in(d, ("/feed",)))
                 log.info("Successfully logged in using saved cookies!")
                 return
-            else:
+            except TimeoutException:
                 log.info("Saved cookies are expired or invalid, need manual login...")
 
         # If no cookies or cookies expired, proceed with manual login
@@ -151,20 +379,28 @@ class EasyApplyBot:
             "https://www.linkedin.com/login?trk=guest_homepage-basic_nav-header-signin"
         )
 
-        # Wait for manual login by checking for the presence of the feed page
+        # Wait for manual login by checking for the presence of the feed page or jobs page,
+        # transient driver errors while the user navigates around are retried like before
         while True:
             try:
-                # Check if we're on the feed page or jobs page
-                if "feed" in self.browser.current_url or "jobs" in self.browser.current_url:
-                    log.info("Successfully logged in!")
-                    # Save cookies after successful login
-                    self.save_cookies()
-                    break
-                time.sleep(2)  # Check every 2 seconds
-            except:
-                continue
+                WebDriverWait(self.browser, 600, ignored_exceptions=[WebDriverException]).until(
+                    lambda d: self.logged_in(d, ("/feed", "/jobs"))
+                )
+                break
+            except TimeoutException:
+                log.info("Still waiting for manual login...")
 
-        time.sleep(3)  # Give a little extra time for the page to fully load
+        log.info("Successfully logged in!")
+        # Save cookies after successful login
+        self.save_cookies()
+
+        # Wait for the page to fully load
+        try:
+            self.long_wait.until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            pass
 
     def fill_data(self):
         self.browser.set_window_position(1, 1)
@@ -174,17 +410,20 @@ class EasyApplyBot:
         self.fill_data()
         log.info("Starting feed search for 'hiring full stack developer'...")
 
-        # Go directly to content search URL
         search_query = "hiring full stack developer"
+
+        # Query the JSON API directly, the rendered search page is only needed if it is unavailable
+        if self.collect_posts_from_api(self.search_posts_api(search_query)):
+            return
+        log.info("No posts returned by the Voyager API, falling back to the browser search...")
+
+        # Go directly to content search URL
         encoded_query = urllib.parse.quote(search_query)
         self.browser.get(f"https://www.linkedin.com/search/results/content/?keywords={encoded_query}&origin=GLOBAL_SEARCH_HEADER&sortBy=%22date_posted%22")
-        time.sleep(3)
 
         try:
             # Wait for the content to load
-            WebDriverWait(self.browser, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "search-results-container"))
-            )
+            self.long_wait.until(EC.presence_of_element_located(self.SEARCH_RESULTS_CONTAINER))
 
             self.scroll_and_collect_posts()
 
@@ -193,119 +432,69 @@ class EasyApplyBot:
 
     def scroll_and_collect_posts(self):
         log.info("Collecting posts from feed...")
-        posts_processed = set()
+        posts_found = 0
         scroll_count = 0
         max_scrolls = 10  # Adjust this number to control how many times to scroll
 
         while scroll_count < max_scrolls:
             try:
                 # Wait for posts to load
-                WebDriverWait(self.browser, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "ember-view"))
-                )
+                self.long_wait.until(EC.presence_of_element_located(self.FEED_POST))
+
+                # Expand every "see more" toggle in view with a single script call
+                expanded = self.browser.execute_script(SEE_MORE_JS, True)
+                if expanded:
+                    # Wait for content to expand, the toggles turn into "see less" once it has
+                    try:
+                        self.wait.until(lambda d: d.execute_script(SEE_MORE_JS, False) == 0)
+                    except TimeoutException:
+                        pass
+                    log.info(f"Expanded {expanded} post(s) by clicking 'see more'")
 
-                # Find all post containers
-                posts = self.browser.find_elements(By.CSS_SELECTOR, ".ember-view .feed-shared-update-v2")
+                # Parse the rendered page once and walk the post nodes locally
+                tree = HTMLParser(self.browser.page_source)
+                post_selector = ".ember-view .feed-shared-update-v2"
+                posts = tree.css(post_selector)
 
                 if not posts:
                     # Try alternative selectors
-                    posts = self.browser.find_elements(By.CSS_SELECTOR, ".ember-view .update-components-actor")
+                    post_selector = ".ember-view .update-components-actor"
+                    posts = tree.css(post_selector)
 
                 log.info(f"Found {len(posts)} posts in current view")
+                scroll_timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
 
                 for post in posts:
                     try:
-                        # Try to get a unique identifier
-                        try:
-                            post_id = post.get_attribute("data-urn") or post.get_attribute("id")
-                        except:
-                            # If we can't get an ID, use the full post text as an identifier
-                            post_id = post.text[:100]
-
-                        if post_id in posts_processed:
-                            continue
-
-                        posts_processed.add(post_id)
+                        # Try to get a unique identifier, falling back to the post text
+                        post_id = (
+                            post.attributes.get("data-urn")
+                            or post.attributes.get("id")
+                            or post.text(separator=" ", strip=True)[:100]
+                        )
 
-                        # Try to expand the post content by clicking "see more" button
-                        try:
-                            see_more_button = post.find_element(By.CSS_SELECTOR,
-                                ".feed-shared-inline-show-more-text__see-more-less-toggle.see-more.t-14.t-black--light.t-normal.hoverable-link-text.feed-shared-inline-show-more-text__dynamic-more-text.feed-shared-inline-show-more-text__dynamic-bidi-text")
-                            if see_more_button and see_more_button.is_displayed():
-                                self.browser.execute_script("arguments[0].click();", see_more_button)
-                                time.sleep(0.5)  # Wait for content to expand
-                                log.info("Expanded post content by clicking 'see more'")
-                        except Exception as e:
-                            # If "see more" button doesn't exist or can't be clicked, continue normally
-                            pass
+                        if not self.mark_post_processed(post_id):
+                            continue
+                        posts_found += 1
 
                         # Get post content - try multiple possible selectors
-                        post_text = ""
-                        for selector in [
-                            ".feed-shared-update-v2__description-wrapper",
-                            ".feed-shared-text",
-                            ".update-components-text",
-                            ".update-components-actor--feed-update-text"
-                        ]:
-                            try:
-                                elements = post.find_elements(By.CSS_SELECTOR, selector)
-                                if elements:
-                                    post_text = elements[0].text
-                                    break
-                            except:
-                                continue
+                        element = first_match(post, POST_TEXT_SELECTORS)
+                        post_text = element.text(separator=" ", strip=True) if element else ""
 
                         if not post_text:
                             continue
 
-                        # Check for job-related keywords
-                        job_keywords = ["hiring", "job", "position", "opportunity", "remote", "full stack", "developer",
-                                      "opening", "looking for", "join our team", "apply", "application", "react", "node"]
-                        matches = sum(1 for keyword in job_keywords if keyword.lower() in post_text.lower())
-
-                        if matches >= 2:  # If at least 2 job-related keywords are found
-                            try:
-                                # Extract emails from post content
-                                emails_found = self.extract_emails_from_text(post_text)
-                                if emails_found:
-                                    self.collected_emails.extend(emails_found)
-                                    log.info(f"Found {len(emails_found)} email(s) in post: {', '.join(emails_found)}")
-                                
-                                # Try various selectors for company name
-                                company_name = "Unknown Company"
-                                for selector in [
-                                    ".update-components-actor__name",
-                                    ".feed-shared-actor__title",
-                                    ".update-components-actor__meta-link"
-                                ]:
-                                    try:
-                                        elements = post.find_elements(By.CSS_SELECTOR, selector)
-                                        if elements:
-                                            company_name = elements[0].text
-                                            break
-                                    except:
-                                        continue
-
-                                # Try to get the post URL
-                                post_link = "URL not found"
-                                try:
-                                    link_element = post.find_element(By.CSS_SELECTOR, "a.app-aware-link")
-                                    post_link = link_element.get_attribute("href")
-                                except:
-                                    pass
-
-                                log.info(f"\nFound potential job post:")
-                                log.info(f"Company: {company_name}")
-                                log.info(f"Post URL: {post_link}")
-                                log.info(f"Content preview: {post_text[:200]}...")
-                                if emails_found:
-                                    log.info(f"Emails found: {', '.join(emails_found)}")
-
-                                # Save to file
-                                self.write_to_file(matches, post_id, f"Feed Post | {company_name}", True)
-
-                            except Exception as e:
-                                log.error(f"Error processing post details: {str(e)}")
+                        # Try various selectors for company name
+                        element = first_match(post, POST_AUTHOR_SELECTORS)
+                        company_name = element.text(separator=" ", strip=True) if element else "Unknown Company"
+
+                        # Try to get the post URL
+                        post_link = "URL not found"
+                        link_element = post.css_first("a.app-aware-link")
+                        if link_element and link_element.attributes.get("href"):
+                            post_link = link_element.attributes["href"]
+
+                        self.process_post(post_id, post_text, company_name, post_link, scroll_timestamp)
 
                     except Exception as e:
                         log.error(f"Error processing post: {str(e)}")
@@ -313,19 +502,144 @@ class EasyApplyBot:
 
                 # Scroll down
                 self.browser.execute_script("window.scrollTo(0, window.pageYOffset + 1000)")
-                time.sleep(2)  # Wait for new content to load
+
+                # Wait for new content to load
+                try:
+                    self.wait.until(
+                        lambda d: d.execute_script(
+                            "return document.querySelectorAll(arguments[0]).length;", post_selector
+                        ) > len(posts)
+                    )
+                except TimeoutException:
+                    log.info("No new posts loaded after scrolling")
                 scroll_count += 1
-                log.info(f"Scrolled {scroll_count} times, found {len(posts_processed)} posts so far")
+                log.info(f"Scrolled {scroll_count} times, found {posts_found} posts so far")
 
             except Exception as e:
                 log.error(f"Error during scroll: {str(e)}")
                 scroll_count += 1
                 continue
         
+        self.finish_post_collection()
+
+    def mark_post_processed(self, post_id):
+        """Remember a post, returns False if it was already processed"""
+        fingerprint = hashlib.blake2b(post_id.encode("utf-8"), digest_size=8).digest()
+        if fingerprint in self.processed_posts:
+            return False
+        self.processed_posts[fingerprint] = None
+        if len(self.processed_posts) > MAX_PROCESSED_POSTS:
+            self.processed_posts.popitem(last=False)
+        return True
+
+    def process_post(self, post_id, post_text, company_name, post_link, timestamp=None):
+        # Check for job-related keywords
+        matches = len({keyword.lower() for keyword in JOB_KEYWORDS_RE.findall(post_text)})
+
+        if matches < 2:  # Need at least 2 job-related keywords
+            return
+
+        try:
+            # Extract emails from post content
+            emails_found = self.extract_emails_from_text(post_text)
+            if emails_found:
+                self.collected_emails.update(emails_found)
+                self.emails_found_count += len(emails_found)
+                log.info(f"Found {len(emails_found)} email(s) in post: {', '.join(emails_found)}")
+
+            log.info(f"\nFound potential job post:")
+            log.info(f"Company: {company_name}")
+            log.info(f"Post URL: {post_link}")
+            log.info(f"Content preview: {post_text[:200]}...")
+            if emails_found:
+                log.info(f"Emails found: {', '.join(emails_found)}")
+
+            # Save to file
+            self.write_to_file(matches, post_id, f"Feed Post | {company_name}", True, timestamp)
+
+        except Exception as e:
+            log.error(f"Error processing post details: {str(e)}")
+
+    def finish_post_collection(self):
         # Save collected emails to file at the end
         self.save_emails_to_file()
         self.show_email_statistics()
-        log.info(f"Finished collecting posts. Total unique emails found: {len(set(self.collected_emails))}")
+        log.info(f"Finished collecting posts. Total unique emails found: {len(self.collected_emails)}")
+
+    def get_api_session(self):
+        """Build a requests session for LinkedIn's Voyager API from the browser cookies"""
+        if self.api_session is None:
+            cookies = self.browser.get_cookies()
+            session = requests.Session()
+            # One keep-alive connection per fetch worker so concurrent job fetches never wait on the pool
+            session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=JOB_FETCH_WORKERS))
+            csrf_token = ""
+            for cookie in cookies:
+                session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""))
+                if cookie["name"] == "JSESSIONID":
+                    csrf_token = cookie["value"].strip('"')
+            session.headers.update({
+                "csrf-token": csrf_token,
+                "x-restli-protocol-version": "2.0.0",
+                "accept": "application/vnd.linkedin.normalized+json+2.1",
+                "user-agent": self.browser.execute_script("return navigator.userAgent;"),
+            })
+            self.api_session = session
+        return self.api_session
+
+    def search_posts_api(self, search_query, max_pages=10):
+        """Search content posts through the Voyager API, yields the posts of each page as soon as it is fetched"""
+        try:
+            session = self.get_api_session()
+        except Exception as e:
+            log.error(f"Error opening a Voyager API session: {str(e)}")
+            return
+
+        for page in range(max_pages):
+            params = {
+                "keywords": search_query,
+                "origin": "GLOBAL_SEARCH_HEADER",
+                "q": "all",
+                "filters": "List(resultType->CONTENT,sortBy->date_posted)",
+                "start": page * VOYAGER_PAGE_SIZE,
+                "count": VOYAGER_PAGE_SIZE,
+            }
+            try:
+                response = session.get(
+                    VOYAGER_SEARCH_URL,
+                    # Rest.li reads unescaped parentheses and commas as structure, everything else is encoded
+                    params=urllib.parse.urlencode(params, safe="(),", quote_via=urllib.parse.quote),
+                    timeout=15,
+                )
+                response.raise_for_status()
+                included = response.json().get("included", [])
+            except Exception as e:
+                log.error(f"Error searching posts through the Voyager API: {str(e)}")
+                return
+
+            if not included:
+                return
+            page_posts = [post for post in map(api_post, included) if post]
+            log.info(f"Fetched page {page + 1} from the Voyager API, found {len(page_posts)} posts")
+            if page_posts:
+                yield page_posts
+
+    def collect_posts_from_api(self, pages):
+        """Process the posts of each API page as it arrives, returns False if the API returned nothing"""
+        log.info("Collecting posts from the Voyager API...")
+        found = False
+        for page_posts in pages:
+            found = True
+            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+            for post_id, post_text, company_name, post_link in page_posts:
+                if not self.mark_post_processed(post_id):
+                    continue
+                self.process_post(post_id, post_text, company_name, post_link, timestamp)
+
+        if found:
+            self.finish_post_collection()
+        return found
+
     # self.finish_apply() --> this does seem to cause more harm than good, since it closes the browser which we usually don't want, other conditions will stop the loop and just break out
 
     def applications_loop(self, position, location):
@@ -355,14 +669,14 @@ class EasyApplyBot:
                 # randoTime = random.uniform(3.5, 4.9)
                 # log.debug(f"Sleeping for {round(randoTime, 1)}")
                 # time.sleep(randoTime)
-                self.load_page(sleep=0.25)
+                self.load_page(wait_for=self.SEARCH_RESULTS_LIST)
 
                 # LinkedIn displays the search results in a scrollable <div> on the left side, we have to scroll to its bottom
-                try:
-                    scrollresults = self.browser.find_element(By.CLASS_NAME, "jobs-search-results-list")
-                except NoSuchElementException:
+                results = self.browser.find_elements(*self.SEARCH_RESULTS_LIST)
+                if not results:
                     log.info("An error occured while searching for jobs, going to next role.")
-                    self.start_apply()
+                    return self.start_apply()
+                scrollresults = results[0]
 
                 # Selenium only detects visible elements; if we scroll to the bottom too fast, only 8-9 results will be loaded into IDs list
                 for i in range(300, 3000, 100):
@@ -370,26 +684,32 @@ class EasyApplyBot:
                         "arguments[0].scrollTo(0, {})".format(i), scrollresults
                     )
 
-                time.sleep(0.25)
+                try:
+                    self.wait.until(lambda d: d.execute_script(JOB_CARDS_RENDERED_JS))
+                except TimeoutException:
+                    pass
 
-                # get job links
-                links = self.browser.find_elements("xpath", "//div[@data-job-id]")
+                # get job cards
+                cards = self.browser.execute_script(JOB_CARDS_JS)
 
-                if len(links) == 0:
+                if len(cards) == 0:
                     log.info("No more jobs, going to next role.")
                     self.start_apply()
 
-                # get job ID of each job link
-                IDs = []
-                blacklistCompaniesLower = [x.lower() for x in self.blacklistCompanies]
-                blackListTitlesLower = [x.lower() for x in self.blackListTitles]
-                for link in links:
-                    jobID = link.get_attribute("data-job-id").split(":")[-1]
-                    if jobID in self.appliedJobIDs:
+                # get job ID of each job card, skipping duplicates and already applied jobs as they come
+                queuedIDs = set()  # only dedupes jobIDs, the page-advance check counts the cards instead
+                jobIDs = []
+                for card in cards:
+                    jobID = int(card["id"].split(":")[-1])
+                    if jobID in self.appliedJobIDs or jobID in queuedIDs:
+                        continue
+                    name = card["title"]
+                    employer = card["company"]
+                    if not name or not employer:
+                        # not rendered yet, an empty name would slip past the blacklists
+                        log.debug(f"Skipping job card {jobID} that has not rendered yet.")
                         continue
-                    name = link.find_element(By.CLASS_NAME, "job-card-list__title").text
-                    employer = link.find_element(By.CLASS_NAME, "job-card-container__primary-description").text
-                    if (name.lower() in blackListTitlesLower or employer.lower() in blacklistCompaniesLower):
+                    if (name.lower() in self.blackListTitlesLower or employer.lower() in self.blacklistCompaniesLower):
                         #log.info(f"Ignoring job posting from blacklist {name} @ {employer}.")
                         continue
 
@@ -398,26 +718,27 @@ class EasyApplyBot:
                     #     #log.info(f"Ignoring non-internship job posting {name} @ {employer}.")
                     #     continue
 
-                    IDs.append(int(jobID))
+                    queuedIDs.add(jobID)
+                    jobIDs.append(jobID)
 
-                # remove duplicates
-                IDs = set(IDs)
-
-                # remove already applied jobs
-                jobIDs = [x for x in IDs if x not in self.appliedJobIDs]
                 after = len(jobIDs)
                 print("JOBS FOUND: " + str(after))
                 if len(jobIDs) == 0:
                     no_jobs_found += 1
 
-                # it assumed that 25 jobs are listed in the results window
-                if len(jobIDs) == 0 and len(IDs) > 23:
+                # it assumed that 25 jobs are listed in the results window, a full page with nothing new to
+                # look at (all applied, blacklisted or duplicated) means moving on to the next page
+                if len(jobIDs) == 0 and len(cards) > 23:
                     jobs_per_page = jobs_per_page + 25
                     count_job = 0
                     self.avoid_lock()
                     self.browser, jobs_per_page = self.next_jobs_page(
                         position, location, jobs_per_page
                     )
+                # fetch every job of the page concurrently, jobs the API can't return are opened in the browser
+                job_details_by_id = self.fetch_jobs_details_api(jobIDs)
+                page_timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+
                 # loop over IDs to apply
                 zero_matches = 0
                 for i, jobID in enumerate(jobIDs):
@@ -425,42 +746,36 @@ class EasyApplyBot:
                         log.info("Looks like jobs are no longer relevant, going to next role.")
                         return self.start_apply()
                     count_job += 1
-                    self.get_job_page(jobID)
 
                     # Check for keywords
-                    keywords = self.keywords
-
                     matches = 0
                     matched_keywords = []
-                    time.sleep(0.1)
-                    show_more = self.browser.find_element(By.CLASS_NAME, "jobs-description__footer-button")
-                    show_more.click()
+                    job_details = job_details_by_id.get(jobID)
+                    if job_details is None:
+                        self.get_job_page(jobID)
+                        job_details = self.browser.execute_script(JOB_DETAILS_JS)
+                        job_details["page_title"] = self.browser.title
 
-                    company_name = self.browser.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__company-name").text
+                    company_name = job_details["company"]
 
-                    job_subtitle = self.browser.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__primary-description-container").text
+                    job_subtitle = job_details["subtitle"]
                     job_location = job_subtitle.split(" · ")[0].strip()
 
-                    job_title = self.browser.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__job-title").text
-                    job_description = self.browser.find_element(By.CLASS_NAME, "jobs-description-content__text").text
-                    #company_logo_url = self.browser.find_element(By.XPATH, "//img[contains(@alt, 'company logo')]").get_attribute("src")
-                    #company_logo_url = self.browser.find_element(By.XPATH, f"//img[contains(@alt, '{company_name} Company logo')]").get_attribute("src")
-                    # find by XPATH with height of 40
-                    company_logo_url = self.browser.find_element(By.XPATH, f"//img[contains(@height, '40')]").get_attribute("src")
+                    job_title = job_details["title"]
+                    job_description = job_details["description"]
+                    company_logo_url = job_details["logo"]
                     posting_url = "https://www.linkedin.com/jobs/view/" + str(jobID)
 
                     # try to get salary
-                    try:
-                        salary = self.browser.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__job-insight").text
-                        if salary.startswith("$"):
-                            salary = salary.split(" ")[0]
-                        else:
-                            salary = "Unknown"
-                    except:
+                    salary = job_details["salary"]
+                    if salary.startswith("$"):
+                        salary = salary.split(" ")[0]
+                    else:
                         salary = "Unknown"
 
-                    for keyword in keywords:
-                        if keyword.lower() in job_description.lower():
+                    job_description_lower = job_description.lower()
+                    for keyword, keyword_lower in self.keywordsLower:
+                        if keyword_lower in job_description_lower:
                             matches += 1
                             matched_keywords.append(keyword)
                     if matches >= 3:
@@ -480,10 +795,10 @@ class EasyApplyBot:
                         if matches == 0:
                             zero_matches += 1
                     position_number = str(count_job + jobs_per_page)
-                    log.info(f"\nPosition {position_number}:\n {self.browser.title} \n {string_easy} \n")
+                    log.info(f"\nPosition {position_number}:\n {job_details['page_title']} \n {string_easy} \n")
 
-                    self.write_to_file(matches, jobID, self.browser.title, result)
-                    self.appliedJobIDs = self.get_appliedIDs(self.filename)  # Reinitialize applied JobIDS
+                    self.write_to_file(matches, jobID, job_details["page_title"], result, page_timestamp)
+                    self.appliedJobIDs.add(jobID)
 
                     # go to new page if all jobs are done
                     if count_job == len(jobIDs):
@@ -497,42 +812,82 @@ class EasyApplyBot:
             except Exception as e:
                 print(e)
 
-    def write_to_file(self, matches, jobID, browserTitle, result):
-        def re_extract(text, pattern):
-            target = re.search(pattern, text)
-            if target:
-                target = target.group(1)
-            return target
+    def fetch_job_details_api(self, jobID):
+        """Fetch a job posting from the Voyager API, returns None if it can't be retrieved"""
+        try:
+            # The session is built on the main thread by fetch_jobs_details_api, the WebDriver is not thread-safe
+            response = self.api_session.get(f"{VOYAGER_JOB_POSTING_URL}/{jobID}", timeout=15)
+            response.raise_for_status()
+            payload = response.json()
+            posting = payload.get("data", payload)
+
+            company = ""
+            logo = ""
+            for entity in payload.get("included", []):
+                if entity.get("$type", "").endswith("Company") and entity.get("name"):
+                    company = entity["name"]
+                    logo = api_company_logo(entity)
+                    break
+
+            title = posting.get("title") or ""
+            description = (posting.get("description") or {}).get("text") or ""
+            if not title or not description:
+                return None
+
+            return {
+                "company": company,
+                "subtitle": posting.get("formattedLocation") or "",
+                "title": title,
+                "description": description,
+                "salary": api_salary(payload),
+                "logo": logo,
+                "page_title": f"{title} | {company} | LinkedIn",
+            }
+        except Exception as e:
+            log.info(f"Could not fetch job {jobID} from the Voyager API: {str(e)}")
+            return None
+
+    def fetch_jobs_details_api(self, jobIDs):
+        try:
+            self.get_api_session()
+        except Exception as e:
+            log.info(f"Could not open a Voyager API session, reading jobs from the browser: {str(e)}")
+            return {}
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with ThreadPoolExecutor(max_workers=JOB_FETCH_WORKERS) as executor:
+            results = executor.map(self.fetch_job_details_api, jobIDs)
+            return {jobID: details for jobID, details in zip(jobIDs, results) if details is not None}
+
+    def write_to_file(self, matches, jobID, browserTitle, result, timestamp=None):
+        if timestamp is None:
+            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
         # attempted = False if button == False else True
-        job = re_extract(browserTitle.split(" | ")[0], r"\(?\d?\)?\s?(\w.*)")
-        company = re_extract(browserTitle.split(" | ")[1], r"(\w.*)")
+        # browser titles look like "(3) Job title | Company | LinkedIn", the "(3) " being the notification count
+        job, _, rest = browserTitle.partition(" | ")
+        if job.startswith("("):
+            count, _, title = job[1:].partition(") ")
+            if title and count.rstrip("+").isdigit():
+                job = title
+        job = job.strip() or None
+        company = rest.partition(" | ")[0].strip() or None
 
         toWrite = [timestamp, jobID, job, company, str(matches), result]
-        with open(self.filename, "a") as f:
-            writer = csv.writer(f)
-            writer.writerow(toWrite)
+        self.output_writer.writerow(toWrite)
 
     def get_job_page(self, jobID):
         jobURL = "https://www.linkedin.com/jobs/view/" + str(jobID)
         self.browser.get(jobURL)
-        self.job_page = self.load_page(sleep=0.25)
-        return self.job_page
-
-    def load_page(self, sleep=0.25):
-        scroll_page = 0
-        while scroll_page < 4000:
-            self.browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
-            scroll_page += 200
-            time.sleep(0.1)
-
-        if sleep != 1:
-            self.browser.execute_script("window.scrollTo(0,0);")
-            time.sleep(sleep * 3)
+        self.load_page(wait_for=self.JOB_DESCRIPTION)
 
-        page = BeautifulSoup(self.browser.page_source, "lxml")
-        return page
+    def load_page(self, wait_for=None):
+        # Scroll to the bottom once to trigger lazy loading, then wait for the element the caller needs
+        self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        if wait_for:
+            try:
+                self.wait.until(EC.presence_of_element_located(wait_for))
+            except TimeoutException:
+                log.info(f"Timed out waiting for {wait_for[1]}")
+        self.browser.execute_script("window.scrollTo(0,0);")
 
     def avoid_lock(self):
         # x, _ = pyautogui.position()
@@ -546,32 +901,20 @@ class EasyApplyBot:
         pass
 
     def next_jobs_page(self, position, location, jobs_per_page):
-        # Easy Apply: ?f_LF=f_AL
-        # Some other things you can do:
-        # - Internships: &f_E=1
-        # - Entry Level: &f_E=2
-
-        self.browser.get(
-            "https://www.linkedin.com/jobs/search/"
-            + f"?keywords={position}"
-            + f"&location={location}"
-            + f"&f_E=2"
-            + f"&f_TPR=r2592000" # r2592000 for 30 days | #r604800 for 7 days
-            + f"&start={str(jobs_per_page)}"
-        )
+        self.browser.get(jobs_search_url(position, location, jobs_per_page))
         # self.avoid_lock()
-        self.load_page(sleep=0.25)
+        self.load_page(wait_for=self.SEARCH_RESULTS_LIST)
         return (self.browser, jobs_per_page)
 
     def finish_apply(self):
+        self.output_file.close()
         self.browser.close()
 
     def save_cookies(self):
         """Save current browser cookies to file"""
         try:
             cookies = self.browser.get_cookies()
-            with open("cookies.pkl", "wb") as f:
-                pickle.dump(cookies, f)
+            write_file_atomically(COOKIES_FILE, json.dumps(cookies))
             log.info("Cookies saved successfully!")
         except Exception as e:
             log.error(f"Error saving cookies: {str(e)}")
@@ -579,23 +922,35 @@ class EasyApplyBot:
     def load_cookies(self):
         """Load cookies from file and add them to browser"""
         try:
-            if not os.path.exists("cookies.pkl"):
+            if not os.path.exists(COOKIES_FILE) and os.path.exists(LEGACY_COOKIES_FILE):
+                self.migrate_legacy_cookies()
+
+            if not os.path.exists(COOKIES_FILE):
                 return False
 
-            with open("cookies.pkl", "rb") as f:
-                cookies = pickle.load(f)
+            with open(COOKIES_FILE, "r") as f:
+                cookies = json.load(f)
 
             # First navigate to LinkedIn domain so we can add cookies
             self.browser.get("https://www.linkedin.com")
-            time.sleep(1)
 
-            # Add each cookie
-            for cookie in cookies:
-                try:
-                    self.browser.add_cookie(cookie)
-                except Exception as e:
-                    # Some cookies might not be valid anymore, just skip them
-                    continue
+            # Add all cookies in a single DevTools call; CDP names the expiration field "expires"
+            try:
+                cdp_cookies = []
+                for cookie in cookies:
+                    cdp_cookie = dict(cookie)
+                    if "expiry" in cdp_cookie:
+                        cdp_cookie["expires"] = cdp_cookie.pop("expiry")
+                    cdp_cookies.append(cdp_cookie)
+                self.browser.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+            except Exception as e:
+                log.info(f"Bulk cookie injection failed, adding cookies one by one: {str(e)}")
+                for cookie in cookies:
+                    try:
+                        self.browser.add_cookie(cookie)
+                    except Exception as e:
+                        # Some cookies might not be valid anymore, just skip them
+                        continue
 
             log.info("Cookies loaded successfully!")
             return True
@@ -604,11 +959,23 @@ class EasyApplyBot:
             log.error(f"Error loading cookies: {str(e)}")
             return False
 
+    def migrate_legacy_cookies(self):
+        """Convert a pickled cookies file from older versions to JSON"""
+        import pickle
+
+        with open(LEGACY_COOKIES_FILE, "rb") as f:
+            cookies = pickle.load(f)
+        write_file_atomically(COOKIES_FILE, json.dumps(cookies))
+        os.remove(LEGACY_COOKIES_FILE)
+        log.info(f"Migrated {LEGACY_COOKIES_FILE} to {COOKIES_FILE}")
+
     def clear_cookies(self):
         """Clear saved cookies file"""
         try:
-            if os.path.exists("cookies.pkl"):
-                os.remove("cookies.pkl")
+            cookie_files = [f for f in (COOKIES_FILE, LEGACY_COOKIES_FILE) if os.path.exists(f)]
+            if cookie_files:
+                for cookie_file in cookie_files:
+                    os.remove(cookie_file)
                 log.info("Cookies cleared successfully!")
             else:
                 log.info("No cookies file found to clear.")
@@ -616,19 +983,15 @@ class EasyApplyBot:
             log.error(f"Error clearing cookies: {str(e)}")
 
     def extract_emails_from_text(self, text):
-        """Extract email addresses from text using regex"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails
+        """Extract unique email addresses from text using regex, in order of appearance"""
+        return list(dict.fromkeys(EMAIL_RE.findall(text)))
     
     def save_emails_to_file(self):
         """Save all collected emails to a file"""
         if self.collected_emails:
             try:
-                with open("collected_emails.txt", "w") as f:
-                    for email in set(self.collected_emails):  # Remove duplicates
-                        f.write(email + "\n")
-                log.info(f"Saved {len(set(self.collected_emails))} unique emails to collected_emails.txt")
+                write_file_atomically("collected_emails.txt", "".join(email + "\n" for email in self.collected_emails))
+                log.info(f"Saved {len(self.collected_emails)} unique emails to collected_emails.txt")
             except Exception as e:
                 log.error(f"Error saving emails: {str(e)}")
         else:
@@ -637,19 +1000,16 @@ class EasyApplyBot:
     def show_email_statistics(self):
         """Show statistics about collected emails"""
         if self.collected_emails:
-            unique_emails = set(self.collected_emails)
+            unique_emails = self.collected_emails
             log.info(f"\n=== EMAIL COLLECTION STATISTICS ===")
-            log.info(f"Total emails found: {len(self.collected_emails)}")
+            log.info(f"Total emails found: {self.emails_found_count}")
             log.info(f"Unique emails: {len(unique_emails)}")
             
             # Show domains statistics
-            domains = {}
-            for email in unique_emails:
-                domain = email.split('@')[1].lower()
-                domains[domain] = domains.get(domain, 0) + 1
+            domains = Counter(email.rsplit('@', 1)[1].lower() for email in unique_emails)
             
             log.info(f"Domains found: {len(domains)}")
-            for domain, count in sorted(domains.items(), key=lambda x: x[1], reverse=True)[:10]:
+            for domain, count in domains.most_common(10):
                 log.info(f"  {domain}: {count} email(s)")
             
             log.info(f"===================================\n")
@@ -657,6 +1017,8 @@ class EasyApplyBot:
             log.info("No emails collected during this session")
 
 if __name__ == "__main__":
+    import yaml
+
     with open("config.yaml", "r") as file:
         try:
             config = yaml.safe_load(file)
@@ -689,5 +1051,6 @@ if __name__ == "__main__":
         positions=positions,
         locations=locations,
         keywords=keywords,
+        headless=config.get("headless", False),
     )
     bot.start_apply()